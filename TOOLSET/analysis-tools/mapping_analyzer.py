@@ -4,12 +4,15 @@ Provides dependency graphs, impact analysis, and reuse metrics
 """
 
 import json
-from typing import Dict, List, Set, Any
+from pathlib import Path
+from typing import Dict, List, Any
 from collections import defaultdict
 from dataclasses import dataclass, asdict
+from functools import cached_property
+from version_tracker import compile_model_name_pattern
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyInfo:
     """Model dependency information"""
     model_name: str
@@ -18,7 +21,7 @@ class DependencyInfo:
     depth: int  # Nesting depth
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactAnalysis:
     """Impact analysis for a model"""
     model_name: str
@@ -28,7 +31,7 @@ class ImpactAnalysis:
     usage_count: int  # How many places use this
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingStats:
     """Mapping statistics"""
     total_models: int
@@ -49,59 +52,75 @@ class MappingAnalyzer:
         self.model_dependencies = {}
         self.model_impact = {}
         self.stats = None
+        self.model_references: Dict[str, tuple[str, ...]] = {}
         
         # Analyze
+        self._index_references()
         self._analyze_dependencies()
         self._analyze_impact()
         self._calculate_stats()
     
+    def _index_references(self):
+        """Collect the models referenced by each model's field types (once per model)"""
+        model_name_re = compile_model_name_pattern(self.tracker.models)
+        
+        for model_name, model in self.tracker.models.items():
+            # Field types joined by a separator no identifier contains
+            field_types = "\n".join(field.type for field in model.fields)
+            if not field_types:
+                self.model_references[model_name] = ()
+                continue
+            found = set(model_name_re.findall(field_types))
+            # Read-only after indexing, so stored as tuples (declaration order)
+            self.model_references[model_name] = tuple(
+                other_model for other_model in self.tracker.models if other_model in found
+            )
+    
     def _analyze_dependencies(self):
         """Analyze model dependencies (which models use which)"""
-        for model_name, model in self.tracker.models.items():
-            depends_on = []
-            used_by = []
-            
-            # Check if fields reference other models
-            for field in model.fields:
-                field_type = field.type
-                # Look for model names in field types
-                for other_model in self.tracker.models.keys():
-                    if other_model in field_type and other_model != model_name:
-                        depends_on.append(other_model)
-            
-            # Find models that reference this model
-            for other_name, other_model in self.tracker.models.items():
-                if other_name == model_name:
-                    continue
-                for field in other_model.fields:
-                    if model_name in field.type:
-                        used_by.append(other_name)
-            
+        # used_by is the inverse of depends_on
+        used_by_by_model = {model_name: [] for model_name in self.tracker.models}
+        for model_name, references in self.model_references.items():
+            for other_model in references:
+                if other_model != model_name:
+                    used_by_by_model[other_model].append(model_name)
+        
+        for model_name, references in self.model_references.items():
             self.model_dependencies[model_name] = DependencyInfo(
                 model_name=model_name,
-                depends_on=list(set(depends_on)),
-                used_by=list(set(used_by)),
-                depth=self._calculate_depth(model_name, set())
+                depends_on=[other for other in references if other != model_name],
+                used_by=used_by_by_model[model_name],
+                depth=self._calculate_depth(model_name)
             )
     
-    def _calculate_depth(self, model_name: str, visited: Set[str]) -> int:
+    def _calculate_depth(self, model_name: str) -> int:
         """Calculate nesting depth of a model"""
-        if model_name in visited:
-            return 0  # Circular reference
+        # Iterative DFS with a backtracked path set (no recursion limit on deep chains).
+        # Each frame is [model, remaining references, depth].
+        path = {model_name}
+        stack = [[model_name, iter(self.model_references.get(model_name, ())), 0]]
+        depth = 0
         
-        visited.add(model_name)
-        model = self.tracker.models.get(model_name)
-        if not model:
-            return 0
-        
-        max_depth = 0
-        for field in model.fields:
-            for other_model in self.tracker.models.keys():
-                if other_model in field.type:
-                    depth = 1 + self._calculate_depth(other_model, visited.copy())
-                    max_depth = max(max_depth, depth)
+        while stack:
+            frame = stack[-1]
+            other_model = next(frame[1], None)
+            
+            if other_model is None:
+                stack.pop()
+                path.discard(frame[0])
+                depth = frame[2]
+                if stack:
+                    stack[-1][2] = max(stack[-1][2], 1 + depth)
+                continue
+            
+            if other_model in path:
+                frame[2] = max(frame[2], 1)  # Circular reference
+                continue
+            
+            path.add(other_model)
+            stack.append([other_model, iter(self.model_references.get(other_model, ())), 0])
         
-        return max_depth
+        return depth
     
     def _analyze_impact(self):
         """Analyze impact of changing each model"""
@@ -133,11 +152,19 @@ class MappingAnalyzer:
         total_models = len(self.tracker.models)
         total_endpoints = len(self.tracker.endpoints)
         
-        # Models used in endpoints
-        models_with_endpoints = sum(
-            1 for m in self.tracker.models.values()
-            if m.used_in_endpoints
-        )
+        # Models used in endpoints, reuse total and most reused model in one pass
+        models_with_endpoints = 0
+        total_endpoint_refs = 0
+        most_reused = None
+        most_reused_count = 0
+        for model in self.tracker.models.values():
+            count = len(model.used_in_endpoints)
+            if count:
+                models_with_endpoints += 1
+                total_endpoint_refs += count
+            if most_reused is None or count > most_reused_count:
+                most_reused = model
+                most_reused_count = count
         
         # Orphaned models
         orphaned_models = total_models - models_with_endpoints
@@ -150,17 +177,8 @@ class MappingAnalyzer:
         endpoint_coverage = (endpoints_with_models / total_endpoints * 100) if total_endpoints > 0 else 0
         
         # Model reuse
-        endpoint_counts = [len(m.used_in_endpoints) for m in self.tracker.models.values()]
-        avg_model_reuse = sum(endpoint_counts) / len(endpoint_counts) if endpoint_counts else 0
-        
-        # Most reused model
-        most_reused = max(
-            self.tracker.models.values(),
-            key=lambda m: len(m.used_in_endpoints),
-            default=None
-        )
+        avg_model_reuse = total_endpoint_refs / total_models if total_models else 0
         most_reused_model = most_reused.name if most_reused else "N/A"
-        most_reused_count = len(most_reused.used_in_endpoints) if most_reused else 0
         
         self.stats = MappingStats(
             total_models=total_models,
@@ -197,9 +215,11 @@ class MappingAnalyzer:
         
         print(f"✓ Mapping analysis exported to: {output_file}")
     
-    def _generate_reuse_matrix(self) -> List[Dict[str, Any]]:
-        """Generate model reuse matrix"""
+    @cached_property
+    def _usage_partition(self) -> tuple:
+        """Split models into reuse matrix rows and orphans in one pass (shared by both exports)"""
         matrix = []
+        orphaned = []
         for model_name, model in self.tracker.models.items():
             if model.used_in_endpoints:
                 matrix.append({
@@ -208,22 +228,24 @@ class MappingAnalyzer:
                     "count": len(model.used_in_endpoints),
                     "file": model.file_path
                 })
+            else:
+                orphaned.append({
+                    "name": model_name,
+                    "file": model.file_path,
+                    "fields": len(model.fields)
+                })
         
         # Sort by usage count descending
         matrix.sort(key=lambda x: x["count"], reverse=True)
-        return matrix
+        return matrix, orphaned
+    
+    def _generate_reuse_matrix(self) -> List[Dict[str, Any]]:
+        """Generate model reuse matrix"""
+        return self._usage_partition[0]
     
     def _get_orphaned_models(self) -> List[Dict[str, str]]:
         """Get models not used in any endpoint"""
-        orphaned = []
-        for model_name, model in self.tracker.models.items():
-            if not model.used_in_endpoints:
-                orphaned.append({
-                    "name": model_name,
-                    "file": model.file_path,
-                    "fields": len(model.fields)
-                })
-        return orphaned
+        return self._usage_partition[1]
     
     def _get_high_risk_models(self) -> List[Dict[str, Any]]:
         """Get models with high change impact"""
@@ -0,0 +1,52 @@
+"""Regression tests for version_tracker.py (run with pytest)"""
+
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from version_tracker import VersionTracker
+
+
+def test_multi_segment_exclude_pattern(tmp_path):
+    """A pattern spanning directories ("app/api") excludes that subtree only"""
+    for rel_path in ("app/api/routes.py", "app/models.py", "apiary/hive.py"):
+        file_path = tmp_path / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("x = 1\n", encoding="utf-8")
+    
+    tracker = VersionTracker(str(tmp_path))
+    tracker.analyze_directory(exclude_patterns=["app/api"], max_workers=1)
+    
+    analyzed = sorted(Path(p).as_posix() for p in tracker.files_analyzed)
+    assert analyzed == ["apiary/hive.py", "app/models.py"]
+
+
+def test_compare_with_old_hash_format_checks_structure(tmp_path):
+    """A baseline without hash_format (md5 hashes) is compared by structure, not hash"""
+    (tmp_path / "models.py").write_text(
+        "from pydantic import BaseModel\n\n"
+        "class User(BaseModel):\n    name: str\n\n"
+        "class Item(BaseModel):\n    title: str\n    price: int\n",
+        encoding="utf-8"
+    )
+    tracker = VersionTracker(str(tmp_path))
+    tracker.analyze_directory(max_workers=1)
+    
+    previous = {
+        "summary": {"total_models": 2},
+        "models": [
+            {"name": "User", "hash": "0123abcd", "base_classes": ["BaseModel"],
+             "fields": [{"name": "name", "type": "str"}]},
+            {"name": "Item", "hash": "4567ef01", "base_classes": ["BaseModel"],
+             "fields": [{"name": "title", "type": "str"}]}
+        ]
+    }
+    previous_file = tmp_path / "previous.json"
+    previous_file.write_text(json.dumps(previous), encoding="utf-8")
+    
+    changes = tracker.compare_with_previous(str(previous_file))
+    
+    assert changes["models_modified"] == ["Item"]
+    assert changes["fields_added"] == {"Item": ["price"]}
@@ -5,18 +5,35 @@ Integrates with Git for versioning and provides YAML output for CI/CD pipelines
 
 import ast
 import os
+import re
+import sys
 import json
-import yaml
+import heapq
 import hashlib
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from datetime import datetime
 from collections import defaultdict
+from itertools import groupby
+from functools import cached_property
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 
-@dataclass
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 64
+
+# Bump when the cached per-file result layout changes
+PARSE_CACHE_FORMAT = 3
+
+# Bump when the model fingerprint changes; recorded in the JSON summary.
+# Analyses without it carry the original md5 hashes (format 1)
+MODEL_HASH_FORMAT = 2
+
+
+@dataclass(slots=True)
 class FieldInfo:
     """Field information with versioning"""
     name: str
@@ -26,7 +43,7 @@ class FieldInfo:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelVersion:
     """Complete model information with version tracking"""
     name: str
@@ -46,7 +63,7 @@ class ModelVersion:
     used_in_endpoints: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointVersion:
     """API endpoint with version tracking"""
     path: str
@@ -64,7 +81,7 @@ class EndpointVersion:
     version: str = "1.0.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class GitInfo:
     """Git repository information"""
     commit_hash: Optional[str] = None
@@ -75,7 +92,7 @@ class GitInfo:
     remote_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result with versioning"""
     timestamp: str
@@ -87,68 +104,98 @@ class AnalysisResult:
     summary: Dict[str, Any]
 
 
+def _json_default(obj: Any) -> Any:
+    """json.dump hook: emit dataclasses field by field and let the encoder recurse"""
+    if hasattr(obj, "__dataclass_fields__"):
+        return {f.name: getattr(obj, f.name) for f in dataclass_fields(obj)}
+    return str(obj)
+
+
+def compile_model_name_pattern(model_names) -> Optional[re.Pattern]:
+    """Regex matching any model name as a whole word; None when there are no names"""
+    # Longest name first; word boundaries keep "User" from matching inside "UserResponse"
+    names = sorted(model_names, key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(map(re.escape, names)) + r")\b") if names else None
+
+
+def _dump_yaml(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """yaml.dump through libyaml's C emitter when PyYAML was built with it"""
+    import yaml
+    
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text unless the file already holds exactly that; True if written"""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+# Tracker copy held by each pool worker process, set once by _init_worker
+_worker_tracker = None
+
+
+def _init_worker(tracker: "VersionTracker"):
+    """Process pool initializer: store the tracker for this worker"""
+    global _worker_tracker
+    _worker_tracker = tracker
+
+
+def _analyze_file_in_worker(file_path: Path) -> tuple:
+    """Top-level (picklable) entry point for parsing one file in a worker"""
+    return _worker_tracker._analyze_file(file_path)
+
+
 class VersionTracker:
     """Track versions of models and API endpoints"""
     
-    def __init__(self, root_path: str, version: str = "1.0.0"):
+    def __init__(self, root_path: str, version: str = "1.0.0", cache_dir: Optional[str] = None):
         self.root_path = Path(root_path).resolve()
         self.project_version = version
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.models: Dict[str, ModelVersion] = {}
         self.endpoints: List[EndpointVersion] = []
         self.files_analyzed: List[str] = []
-        self.git_info = self._get_git_info()
-        
+        self._file_git_cache: Dict[str, tuple] = {}
+    
+    @cached_property
+    def git_info(self) -> GitInfo:
+        """Repository git info, looked up on first use"""
+        return self._get_git_info()
+    
     def _get_git_info(self) -> GitInfo:
         """Extract Git repository information"""
         try:
-            # Check if in git repo
-            subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=self.root_path,
-                capture_output=True,
-                check=True
-            )
-            
-            # Get commit hash
-            commit = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.root_path,
-                capture_output=True,
-                text=True
-            ).stdout.strip()
-            
-            # Get branch
-            branch = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=self.root_path,
-                capture_output=True,
-                text=True
-            ).stdout.strip()
-            
-            # Get author
-            author = subprocess.run(
-                ["git", "log", "-1", "--format=%an <%ae>"],
+            # Commit, author and timestamp in one call; fails outside a repo
+            log = subprocess.run(
+                ["git", "log", "-1", "--format=%H%x1f%an <%ae>%x1f%aI"],
                 cwd=self.root_path,
                 capture_output=True,
                 text=True
-            ).stdout.strip()
-            
-            # Get timestamp
-            timestamp = subprocess.run(
-                ["git", "log", "-1", "--format=%aI"],
-                cwd=self.root_path,
-                capture_output=True,
-                text=True
-            ).stdout.strip()
+            )
+            if log.returncode != 0:
+                raise RuntimeError(log.stderr.strip() or f"git log exited with {log.returncode}")
+            commit, author, timestamp = log.stdout.strip().split("\x1f")
             
-            # Check if dirty
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
+            # Branch and dirty state: first line is "## <branch>[...<upstream>]"
+            status_lines = subprocess.run(
+                ["git", "status", "--porcelain", "--branch"],
                 cwd=self.root_path,
                 capture_output=True,
                 text=True
-            ).stdout.strip()
-            is_dirty = bool(status)
+            ).stdout.splitlines()
+            branch = None
+            if status_lines and status_lines[0].startswith("## "):
+                branch = status_lines.pop(0)[3:].split("...", 1)[0].split(" ", 1)[0]
+            is_dirty = bool(status_lines)
             
             # Get remote URL
             remote = subprocess.run(
@@ -170,67 +217,198 @@ class VersionTracker:
             print(f"Warning: Could not get Git info: {e}")
             return GitInfo()
     
-    def _get_file_git_info(self, file_path: Path) -> tuple:
-        """Get last modified info for specific file"""
+    def _prime_file_git_cache(self, rel_paths: List[str]):
+        """Record last commit info for each file from a single git log pass"""
+        self._file_git_cache = {}
+        pending = set(rel_paths)
+        if not pending:
+            return
+        
         try:
-            # Get last commit that modified this file
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%H|%aI|%an", "--", str(file_path)],
+            # Newest commits come first; stop reading once every file has been seen
+            proc = subprocess.Popen(
+                ["git", "-c", "core.quotePath=false", "log", "--relative", "--name-only",
+                 "--format=%x1e%H|%aI|%an", "--", "*.py"],
                 cwd=self.root_path,
-                capture_output=True,
-                text=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace"
             )
-            if result.stdout.strip():
-                commit, timestamp, author = result.stdout.strip().split("|")
-                return commit, timestamp, author
         except Exception:
-            pass
-        return None, None, None
+            return
+        
+        with proc:
+            commit_info = None
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("\x1e"):
+                    commit_info = tuple(line[1:].split("|", 2))
+                elif line in pending and commit_info:
+                    self._file_git_cache[line] = commit_info
+                    pending.discard(line)
+                    if not pending:
+                        break
+    
+    def _get_file_git_info(self, posix_path: str) -> tuple:
+        """Get last modified info for specific file (root-relative posix path)"""
+        return self._file_git_cache.get(posix_path, (None, None, None))
     
-    def analyze_directory(self, exclude_patterns: List[str] = None):
+    def analyze_directory(self, exclude_patterns: List[str] = None, max_workers: Optional[int] = None):
         """Analyze all Python files in directory"""
         if exclude_patterns is None:
             exclude_patterns = ["venv", ".venv", "__pycache__", "node_modules", ".git", "analysis_output"]
         
+        def is_excluded(path: str) -> bool:
+            rel_path = os.path.relpath(path, self.root_path)
+            return any(pattern in rel_path for pattern in exclude_patterns)
+        
+        # Prune excluded directories before descending into them (venvs, .git, ...);
+        # patterns match the root-relative path, so "app/api" works as well as "venv"
         python_files = []
-        for py_file in self.root_path.rglob("*.py"):
-            if any(pattern in str(py_file) for pattern in exclude_patterns):
-                continue
-            python_files.append(py_file)
+        for dirpath, dirnames, filenames in os.walk(self.root_path):
+            dirnames[:] = [d for d in dirnames if not is_excluded(os.path.join(dirpath, d))]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    file_path = os.path.join(dirpath, filename)
+                    if not is_excluded(file_path):
+                        python_files.append(Path(file_path))
         
-        for py_file in python_files:
-            self._analyze_file(py_file)
+        self._prime_file_git_cache([f.relative_to(self.root_path).as_posix() for f in python_files])
+        
+        # Parsing is GIL-bound, so spread files over processes; small trees stay serial
+        # because starting the pool costs more than it saves
+        workers = max_workers or os.cpu_count() or 1
+        endpoint_types = []
+        if workers > 1 and len(python_files) >= PARALLEL_MIN_FILES:
+            # max_workers as given: with None the executor applies its own cap (61 on Windows)
+            with ProcessPoolExecutor(max_workers=max_workers or None, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                results = executor.map(_analyze_file_in_worker, python_files, chunksize=16)
+                self._merge_results(python_files, results, endpoint_types)
+        else:
+            results = map(self._analyze_file, python_files)
+            self._merge_results(python_files, results, endpoint_types)
+        
+        self._link_endpoints(endpoint_types)
+    
+    def _merge_results(self, python_files: List[Path], results, endpoint_types: List[tuple]):
+        """Collect per-file results in file order"""
+        for py_file, (models, endpoints, error, cache_hit) in zip(python_files, results):
+            if error is not None:
+                print(f"Error analyzing {py_file}: {error}")
+            elif self.cache_dir:
+                if cache_hit:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+            for model in models:
+                self.models[model.name] = model
+            endpoint_types.extend(endpoints)
             self.files_analyzed.append(str(py_file.relative_to(self.root_path)))
     
-    def _analyze_file(self, file_path: Path):
-        """Analyze a single Python file"""
+    def _analyze_file(self, file_path: Path) -> tuple:
+        """Analyze a single Python file, returning (models, endpoints, error, cache_hit)"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # ast.parse decodes bytes itself (BOM / PEP 263 aware), so skip a text decode here
+            content = file_path.read_bytes()
             
-            tree = ast.parse(content, filename=str(file_path))
+            # Path forms reused by every model/endpoint in this file
+            rel_path = file_path.relative_to(self.root_path)
+            posix_path = rel_path.as_posix()
+            module = posix_path[:-3].replace("/", ".")
             
             # Get git info for this file
-            commit, timestamp, author = self._get_file_git_info(file_path)
+            commit, timestamp, author = self._get_file_git_info(posix_path)
+            
+            cache_file = self._parse_cache_file(posix_path, content) if self.cache_dir else None
+            cached = self._load_parse_cache(cache_file) if cache_file else None
+            if cached:
+                models, endpoints = cached
+                # Git info is not part of the key, so refresh it from this run
+                for model in models:
+                    model.git_commit = commit
+                    model.git_author = author
+                    model.last_modified = timestamp
+                return models, endpoints, None, True
+            
+            tree = ast.parse(content, filename=str(file_path))
             
             # Extract models and endpoints
-            self._extract_models(tree, file_path, commit, timestamp, author)
-            self._extract_endpoints(tree, file_path)
+            models, endpoints = self._extract_definitions(
+                tree, str(rel_path), module, commit, timestamp, author
+            )
+            if cache_file:
+                self._store_parse_cache(cache_file, models, endpoints)
+            return models, endpoints, None, False
             
         except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
+            return [], [], str(e), False
+    
+    def _parse_cache_file(self, posix_path: str, content: bytes) -> Path:
+        """Cache entry for a file, keyed on its source and everything baked into the result"""
+        key = hashlib.sha256()
+        key.update(f"{PARSE_CACHE_FORMAT}|{sys.version_info[:2]}|{self.project_version}|".encode())
+        key.update(posix_path.encode("utf-8") + b"\0")
+        key.update(content)
+        return self.cache_dir / f"{key.hexdigest()}.json"
+    
+    def _load_parse_cache(self, cache_file: Path) -> Optional[tuple]:
+        """Load cached (models, endpoints) for a file; None on miss or unreadable entry"""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            models = [
+                ModelVersion(**{**m, "fields": [FieldInfo(**fi) for fi in m["fields"]]})
+                for m in data["models"]
+            ]
+            endpoints = [
+                (EndpointVersion(**e), arg_types, return_type)
+                for e, arg_types, return_type in data["endpoints"]
+            ]
+            return models, endpoints
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
     
-    def _extract_models(self, tree: ast.AST, file_path: Path, commit: str, timestamp: str, author: str):
-        """Extract model definitions"""
+    def _store_parse_cache(self, cache_file: Path, models: List[ModelVersion], endpoints: List[tuple]):
+        """Write a cache entry atomically so parallel workers never see partial files"""
+        data = {
+            "models": models,
+            "endpoints": endpoints
+        }
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, default=_json_default)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write parse cache {cache_file}: {e}")
+    
+    def _extract_definitions(self, tree: ast.AST, rel_path: str, module: str, commit: str,
+                             timestamp: str, author: str) -> tuple:
+        """Extract model and endpoint definitions in a single walk over the tree"""
+        models = []
+        endpoints = []
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
-                model = self._parse_model(node, file_path, commit, timestamp, author)
+                model = self._parse_model(node, rel_path, module, commit, timestamp, author)
                 if model:
-                    self.models[model.name] = model
+                    models.append(model)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                endpoint = self._parse_endpoint(node, rel_path)
+                if endpoint:
+                    endpoints.append(endpoint)
+        return models, endpoints
     
-    def _parse_model(self, node: ast.ClassDef, file_path: Path, 
+    def _parse_model(self, node: ast.ClassDef, rel_path: str, module: str,
                      commit: str, timestamp: str, author: str) -> Optional[ModelVersion]:
         """Parse a class into ModelVersion"""
+        # Plain classes (no bases, no decorators) can't be models
+        if not (node.bases or node.decorator_list):
+            return None
+        
         # Get base classes
         base_classes = []
         for base in node.bases:
@@ -241,8 +419,7 @@ class VersionTracker:
         
         # Check if it's a model we care about
         is_pydantic = any("BaseModel" in base for base in base_classes)
-        decorators = [self._get_decorator_name(d) for d in node.decorator_list]
-        is_dataclass = "dataclass" in decorators
+        is_dataclass = any(self._get_decorator_name(d) == "dataclass" for d in node.decorator_list)
         
         if not (is_pydantic or is_dataclass):
             return None
@@ -270,16 +447,14 @@ class VersionTracker:
                 )
                 fields.append(field_info)
         
-        # Calculate hash of model structure
-        model_structure = {
-            "name": node.name,
-            "bases": sorted(base_classes),
-            "fields": sorted([f.name + ":" + f.type for f in fields])
-        }
-        model_hash = hashlib.md5(json.dumps(model_structure, sort_keys=True).encode()).hexdigest()[:8]
-        
-        # Get module path
-        module = str(file_path.relative_to(self.root_path)).replace("\\", ".").replace("/", ".").replace(".py", "")
+        # Calculate hash of model structure (name, bases, fields; order-independent),
+        # fed straight into the hasher with separator bytes between parts
+        hasher = hashlib.blake2b(node.name.encode(), digest_size=4)
+        for base in sorted(base_classes):
+            hasher.update(b"\0" + base.encode())
+        for f in sorted(fields, key=attrgetter("name", "type")):
+            hasher.update(b"\1" + f.name.encode() + b":" + f.type.encode())
+        model_hash = hasher.hexdigest()
         
         # Determine version (could be enhanced with more sophisticated logic)
         version = self.project_version
@@ -287,7 +462,7 @@ class VersionTracker:
         return ModelVersion(
             name=node.name,
             version=version,
-            file_path=str(file_path.relative_to(self.root_path)),
+            file_path=rel_path,
             line_number=node.lineno,
             module=module,
             base_classes=base_classes,
@@ -301,26 +476,35 @@ class VersionTracker:
             last_modified=timestamp
         )
     
-    def _extract_endpoints(self, tree: ast.AST, file_path: Path):
-        """Extract FastAPI endpoint definitions"""
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                endpoint = self._parse_endpoint(node, file_path)
-                if endpoint:
-                    self.endpoints.append(endpoint)
-                    
-                    # Link models to endpoints
-                    if endpoint.request_model and endpoint.request_model in self.models:
-                        self.models[endpoint.request_model].used_in_endpoints.append(
-                            f"{endpoint.method} {endpoint.path}"
-                        )
-                    if endpoint.response_model and endpoint.response_model in self.models:
-                        self.models[endpoint.response_model].used_in_endpoints.append(
-                            f"{endpoint.method} {endpoint.path}"
-                        )
-    
-    def _parse_endpoint(self, node: ast.FunctionDef, file_path: Path) -> Optional[EndpointVersion]:
-        """Parse a function into EndpointVersion"""
+    def _link_endpoints(self, endpoint_types: List[tuple]):
+        """Resolve endpoint request/response models once every model is known"""
+        model_name_re = compile_model_name_pattern(self.models)
+        
+        for endpoint, arg_types, return_type in endpoint_types:
+            # Check if annotations mention a model name we recognize
+            if model_name_re:
+                for type_str in arg_types:
+                    match = model_name_re.search(type_str)
+                    if match:
+                        endpoint.request_model = match.group(1)
+                
+                if return_type:
+                    match = model_name_re.search(return_type)
+                    if match:
+                        endpoint.response_model = match.group(1)
+            
+            self.endpoints.append(endpoint)
+            
+            # Link models to endpoints; names only come from model_name_re, so they are keys
+            label = f"{endpoint.method} {endpoint.path}"
+            if endpoint.request_model:
+                self.models[endpoint.request_model].used_in_endpoints.append(label)
+            # Same model as request and response is one usage, not two
+            if endpoint.response_model and endpoint.response_model != endpoint.request_model:
+                self.models[endpoint.response_model].used_in_endpoints.append(label)
+    
+    def _parse_endpoint(self, node: ast.FunctionDef, rel_path: str) -> Optional[tuple]:
+        """Parse a function into (EndpointVersion, arg annotation strings, return annotation string)"""
         # Check for FastAPI decorators
         http_method = None
         endpoint_path = None
@@ -350,25 +534,9 @@ class VersionTracker:
         if not http_method:
             return None
         
-        # Extract request and response models from type hints
-        request_model = None
-        response_model = None
-        
-        for arg in node.args.args:
-            if arg.annotation:
-                type_str = self._get_annotation_str(arg.annotation)
-                # Check if it's a model name we recognize
-                for model_name in self.models.keys():
-                    if model_name in type_str:
-                        request_model = model_name
-                        break
-        
-        if node.returns:
-            type_str = self._get_annotation_str(node.returns)
-            for model_name in self.models.keys():
-                if model_name in type_str:
-                    response_model = model_name
-                    break
+        # Request/response models are resolved in _link_endpoints once all files are parsed
+        arg_types = [self._get_annotation_str(arg.annotation) for arg in node.args.args if arg.annotation]
+        return_type = self._get_annotation_str(node.returns) if node.returns else None
         
         # Get docstring for summary/description
         docstring = ast.get_docstring(node)
@@ -379,20 +547,19 @@ class VersionTracker:
             summary = lines[0].strip()
             description = lines[1].strip() if len(lines) > 1 else None
         
-        return EndpointVersion(
+        endpoint = EndpointVersion(
             path=endpoint_path or f"/{node.name}",
             method=http_method,
             function_name=node.name,
-            file_path=str(file_path.relative_to(self.root_path)),
+            file_path=rel_path,
             line_number=node.lineno,
-            request_model=request_model,
-            response_model=response_model,
             tags=tags,
             summary=summary,
             description=description,
             deprecated=deprecated,
             version=self.project_version
         )
+        return endpoint, arg_types, return_type
     
     def _get_decorator_name(self, decorator: ast.expr) -> str:
         """Get decorator name as string"""
@@ -422,8 +589,14 @@ class VersionTracker:
         """Convert annotation to string"""
         if annotation is None:
             return ""
+        # Bare and single-dotted names (str, User, datetime.date) are most annotations
+        if isinstance(annotation, ast.Name):
+            return annotation.id
+        # Interned: the same few type strings (Optional[str], List[int], ...) repeat across models
+        if isinstance(annotation, ast.Attribute) and isinstance(annotation.value, ast.Name):
+            return sys.intern(f"{annotation.value.id}.{annotation.attr}")
         try:
-            return ast.unparse(annotation)
+            return sys.intern(ast.unparse(annotation))
         except:
             return str(annotation)
     
@@ -443,7 +616,14 @@ class VersionTracker:
                 previous_data = json.load(f)
             
             previous_models = {m["name"]: m for m in previous_data.get("models", [])}
-            current_models = {name: asdict(model) for name, model in self.models.items()}
+            current_models = self.models
+            
+            # Hashes from another fingerprint format never match; compare structure instead
+            previous_hash_format = previous_data.get("summary", {}).get("hash_format", 1)
+            hashes_comparable = previous_hash_format == MODEL_HASH_FORMAT
+            if not hashes_comparable:
+                print(f"Warning: {previous_file} uses model hash format {previous_hash_format} "
+                      f"(current: {MODEL_HASH_FORMAT}); comparing model structure instead")
             
             changes = {
                 "models_added": [],
@@ -455,11 +635,6 @@ class VersionTracker:
                 "breaking_changes": []
             }
             
-            # Find added models
-            for name in current_models:
-                if name not in previous_models:
-                    changes["models_added"].append(name)
-            
             # Find removed models
             for name in previous_models:
                 if name not in current_models:
@@ -470,63 +645,77 @@ class VersionTracker:
                         "severity": "high"
                     })
             
-            # Find modified models
-            for name in current_models:
-                if name in previous_models:
-                    current = current_models[name]
-                    previous = previous_models[name]
-                    
-                    if current["hash"] != previous.get("hash"):
-                        changes["models_modified"].append(name)
-                        
-                        # Detailed field comparison
-                        current_fields = {f["name"]: f for f in current["fields"]}
-                        previous_fields = {f["name"]: f for f in previous.get("fields", [])}
-                        
-                        # Fields added
-                        for field_name in current_fields:
-                            if field_name not in previous_fields:
-                                changes["fields_added"].setdefault(name, []).append(field_name)
-                                
-                                # Breaking change if required field added
-                                if current_fields[field_name]["required"]:
-                                    changes["breaking_changes"].append({
-                                        "type": "required_field_added",
-                                        "model": name,
-                                        "field": field_name,
-                                        "severity": "high"
-                                    })
-                        
-                        # Fields removed
-                        for field_name in previous_fields:
-                            if field_name not in current_fields:
-                                changes["fields_removed"].setdefault(name, []).append(field_name)
-                                changes["breaking_changes"].append({
-                                    "type": "field_removed",
-                                    "model": name,
-                                    "field": field_name,
-                                    "severity": "high"
-                                })
+            # Find added and modified models in one pass
+            for name, current in current_models.items():
+                previous = previous_models.get(name)
+                if previous is None:
+                    changes["models_added"].append(name)
+                    continue
+                if hashes_comparable:
+                    if current.hash == previous.get("hash"):
+                        continue
+                elif self._same_structure(current, previous):
+                    continue
+                
+                changes["models_modified"].append(name)
+                
+                # Detailed field comparison: one pass over current fields for
+                # added/type-changed, one over previous fields for removed
+                current_fields = {f.name: f for f in current.fields}
+                previous_fields = {f["name"]: f for f in previous.get("fields", [])}
+                type_changes = []
+                
+                for field_name, current_field in current_fields.items():
+                    previous_field = previous_fields.get(field_name)
+                    if previous_field is None:
+                        changes["fields_added"].setdefault(name, []).append(field_name)
                         
-                        # Fields modified (type changed)
-                        for field_name in current_fields:
-                            if field_name in previous_fields:
-                                if current_fields[field_name]["type"] != previous_fields[field_name]["type"]:
-                                    changes["fields_modified"].setdefault(name, []).append(field_name)
-                                    changes["breaking_changes"].append({
-                                        "type": "field_type_changed",
-                                        "model": name,
-                                        "field": field_name,
-                                        "old_type": previous_fields[field_name]["type"],
-                                        "new_type": current_fields[field_name]["type"],
-                                        "severity": "high"
-                                    })
+                        # Breaking change if required field added
+                        if current_field.required:
+                            changes["breaking_changes"].append({
+                                "type": "required_field_added",
+                                "model": name,
+                                "field": field_name,
+                                "severity": "high"
+                            })
+                    elif current_field.type != previous_field["type"]:
+                        changes["fields_modified"].setdefault(name, []).append(field_name)
+                        type_changes.append({
+                            "type": "field_type_changed",
+                            "model": name,
+                            "field": field_name,
+                            "old_type": previous_field["type"],
+                            "new_type": current_field.type,
+                            "severity": "high"
+                        })
+                
+                for field_name in previous_fields:
+                    if field_name not in current_fields:
+                        changes["fields_removed"].setdefault(name, []).append(field_name)
+                        changes["breaking_changes"].append({
+                            "type": "field_removed",
+                            "model": name,
+                            "field": field_name,
+                            "severity": "high"
+                        })
+                
+                # Keep the report order: added, removed, then type changes
+                changes["breaking_changes"].extend(type_changes)
             
             return changes
         except Exception as e:
             print(f"Error comparing with previous version: {e}")
             return {}
     
+    @staticmethod
+    def _same_structure(current: ModelVersion, previous: Dict[str, Any]) -> bool:
+        """Compare what the model hash covers (bases, field names and types) directly"""
+        return (
+            sorted(current.base_classes) == sorted(previous.get("base_classes", []))
+            and sorted((f.name, f.type) for f in current.fields)
+            == sorted((f["name"], f["type"]) for f in previous.get("fields", []))
+        )
+    
     def export_to_json(self, output_file: str = ".tool-outputs/analysis/version_analysis.json"):
         """Export complete analysis to JSON"""
         result = AnalysisResult(
@@ -542,12 +731,14 @@ class VersionTracker:
                 "pydantic_models": sum(1 for m in self.models.values() if m.is_pydantic),
                 "dataclasses": sum(1 for m in self.models.values() if m.is_dataclass),
                 "files_analyzed": len(self.files_analyzed),
-                "project_version": self.project_version
+                "project_version": self.project_version,
+                "hash_format": MODEL_HASH_FORMAT
             }
         )
         
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(asdict(result), f, indent=2, default=str)
+            # Dataclasses are expanded by _json_default
+            json.dump(result, f, indent=2, default=_json_default)
         
         print(f"✓ Exported version analysis to: {output_file}")
         return output_file
@@ -567,36 +758,30 @@ class VersionTracker:
             "endpoints": []
         }
         
-        # Group models by file
-        models_by_file = defaultdict(list)
-        for model in self.models.values():
-            models_by_file[model.file_path].append(model)
-        
-        # Export models
-        for file_path, models in sorted(models_by_file.items()):
-            for model in models:
-                model_data = {
-                    "name": model.name,
-                    "version": model.version,
-                    "file": model.file_path,
-                    "module": model.module,
-                    "hash": model.hash,
-                    "type": "pydantic" if model.is_pydantic else "dataclass",
-                    "fields": [
-                        {
-                            "name": f.name,
-                            "type": f.type,
-                            "required": f.required,
-                            "default": f.default
-                        }
-                        for f in model.fields
-                    ],
-                    "used_in": model.used_in_endpoints,
-                    "last_modified": model.last_modified
-                }
-                if model.docstring:
-                    model_data["description"] = model.docstring
-                data["models"].append(model_data)
+        # Export models grouped by file (stable sort keeps per-file definition order)
+        for model in sorted(self.models.values(), key=attrgetter("file_path")):
+            model_data = {
+                "name": model.name,
+                "version": model.version,
+                "file": model.file_path,
+                "module": model.module,
+                "hash": model.hash,
+                "type": "pydantic" if model.is_pydantic else "dataclass",
+                "fields": [
+                    {
+                        "name": f.name,
+                        "type": f.type,
+                        "required": f.required,
+                        "default": f.default
+                    }
+                    for f in model.fields
+                ],
+                "used_in": model.used_in_endpoints,
+                "last_modified": model.last_modified
+            }
+            if model.docstring:
+                model_data["description"] = model.docstring
+            data["models"].append(model_data)
         
         # Export endpoints
         for endpoint in self.endpoints:
@@ -620,7 +805,7 @@ class VersionTracker:
             data["endpoints"].append(endpoint_data)
         
         with open(output_file, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+            _dump_yaml(data, f, sort_keys=False, default_flow_style=False)
         
         print(f"✓ Exported to YAML: {output_file}")
         return output_file
@@ -630,20 +815,13 @@ class VersionTracker:
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # Group by file
-        models_by_file = defaultdict(list)
-        endpoints_by_file = defaultdict(list)
-        
-        for model in self.models.values():
-            models_by_file[model.file_path].append(model)
+        # Walk models and endpoints sorted by file, one group per manifest
+        by_file = attrgetter("file_path")
+        models = sorted(self.models.values(), key=by_file)
+        endpoints = sorted(self.endpoints, key=by_file)
+        rendered = []
         
-        for endpoint in self.endpoints:
-            endpoints_by_file[endpoint.file_path].append(endpoint)
-        
-        # Get all files
-        all_files = set(models_by_file.keys()) | set(endpoints_by_file.keys())
-        
-        for file_path in all_files:
+        for file_path, items in groupby(heapq.merge(models, endpoints, key=by_file), key=by_file):
             manifest = {
                 "file": file_path,
                 "version": self.project_version,
@@ -651,78 +829,81 @@ class VersionTracker:
                 "endpoints": []
             }
             
-            # Add models
-            for model in models_by_file.get(file_path, []):
-                manifest["models"].append({
-                    "name": model.name,
-                    "hash": model.hash,
-                    "fields": [{"name": f.name, "type": f.type} for f in model.fields]
-                })
-            
-            # Add endpoints
-            for endpoint in endpoints_by_file.get(file_path, []):
-                manifest["endpoints"].append({
-                    "path": endpoint.path,
-                    "method": endpoint.method,
-                    "request": endpoint.request_model,
-                    "response": endpoint.response_model
-                })
+            for item in items:
+                if isinstance(item, ModelVersion):
+                    manifest["models"].append({
+                        "name": item.name,
+                        "hash": item.hash,
+                        "fields": [{"name": f.name, "type": f.type} for f in item.fields]
+                    })
+                else:
+                    manifest["endpoints"].append({
+                        "path": item.path,
+                        "method": item.method,
+                        "request": item.request_model,
+                        "response": item.response_model
+                    })
             
-            # Write manifest
+            # Render manifest; files are written together below
             safe_filename = file_path.replace("/", "_").replace("\\", "_").replace(".py", ".yaml")
-            manifest_file = output_path / safe_filename
-            
-            with open(manifest_file, "w", encoding="utf-8") as f:
-                yaml.dump(manifest, f, sort_keys=False)
+            rendered.append((output_path / safe_filename, _dump_yaml(manifest, sort_keys=False)))
+        
+        # Independent small files: overlap the open/write/close syscalls across threads.
+        # Unchanged manifests keep their mtime so downstream tooling sees no churn.
+        with ThreadPoolExecutor(max_workers=min(16, len(rendered) or 1)) as executor:
+            list(executor.map(lambda item: _write_if_changed(*item), rendered))
         
-        print(f"✓ Exported {len(all_files)} file manifests to: {output_dir}/")
+        print(f"✓ Exported {len(rendered)} file manifests to: {output_dir}/")
         return output_path
     
     def print_summary(self):
         """Print analysis summary"""
-        print("\n" + "=" * 70)
-        print("VERSION TRACKER ANALYSIS")
-        print("=" * 70)
-        print(f"Project: {self.root_path}")
-        print(f"Version: {self.project_version}")
+        lines = []
+        lines.append("\n" + "=" * 70)
+        lines.append("VERSION TRACKER ANALYSIS")
+        lines.append("=" * 70)
+        lines.append(f"Project: {self.root_path}")
+        lines.append(f"Version: {self.project_version}")
         
         if self.git_info.commit_hash:
-            print(f"\nGit Info:")
-            print(f"  Commit:  {self.git_info.commit_hash[:8]}")
-            print(f"  Branch:  {self.git_info.branch}")
-            print(f"  Author:  {self.git_info.author}")
-            print(f"  Dirty:   {self.git_info.is_dirty}")
+            lines.append(f"\nGit Info:")
+            lines.append(f"  Commit:  {self.git_info.commit_hash[:8]}")
+            lines.append(f"  Branch:  {self.git_info.branch}")
+            lines.append(f"  Author:  {self.git_info.author}")
+            lines.append(f"  Dirty:   {self.git_info.is_dirty}")
         
-        print(f"\nModels: {len(self.models)}")
-        print(f"  Pydantic: {sum(1 for m in self.models.values() if m.is_pydantic)}")
-        print(f"  Dataclass: {sum(1 for m in self.models.values() if m.is_dataclass)}")
+        lines.append(f"\nModels: {len(self.models)}")
+        lines.append(f"  Pydantic: {sum(1 for m in self.models.values() if m.is_pydantic)}")
+        lines.append(f"  Dataclass: {sum(1 for m in self.models.values() if m.is_dataclass)}")
         
-        print(f"\nEndpoints: {len(self.endpoints)}")
+        lines.append(f"\nEndpoints: {len(self.endpoints)}")
         methods = defaultdict(int)
         for ep in self.endpoints:
             methods[ep.method] += 1
         for method, count in sorted(methods.items()):
-            print(f"  {method}: {count}")
+            lines.append(f"  {method}: {count}")
         
-        print(f"\nFiles Analyzed: {len(self.files_analyzed)}")
+        lines.append(f"\nFiles Analyzed: {len(self.files_analyzed)}")
         
         if self.models:
-            print(f"\nTop Models:")
+            lines.append(f"\nTop Models:")
             for model in list(self.models.values())[:5]:
-                print(f"  • {model.name} ({len(model.fields)} fields) - {model.file_path}")
+                lines.append(f"  • {model.name} ({len(model.fields)} fields) - {model.file_path}")
                 if model.used_in_endpoints:
-                    print(f"    Used in: {', '.join(model.used_in_endpoints[:3])}")
+                    lines.append(f"    Used in: {', '.join(model.used_in_endpoints[:3])}")
         
         if self.endpoints:
-            print(f"\nAPI Endpoints:")
+            lines.append(f"\nAPI Endpoints:")
             for endpoint in self.endpoints[:10]:
-                print(f"  • {endpoint.method:6} {endpoint.path}")
+                lines.append(f"  • {endpoint.method:6} {endpoint.path}")
                 if endpoint.request_model:
-                    print(f"           ← {endpoint.request_model}")
+                    lines.append(f"           ← {endpoint.request_model}")
                 if endpoint.response_model:
-                    print(f"           → {endpoint.response_model}")
+                    lines.append(f"           → {endpoint.response_model}")
         
-        print("=" * 70 + "\n")
+        lines.append("=" * 70 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -779,6 +960,16 @@ def main():
         default=["venv", ".venv", "__pycache__", "node_modules"],
         help="Patterns to exclude"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for parsing (default: CPU count, 1 disables)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Reuse per-file parse results stored in DIR (e.g. .tool-outputs/ast-cache)"
+    )
     
     args = parser.parse_args()
     
@@ -787,9 +978,11 @@ def main():
     output_dir.mkdir(exist_ok=True)
     
     # Analyze
-    tracker = VersionTracker(args.path, version=args.version)
+    tracker = VersionTracker(args.path, version=args.version, cache_dir=args.cache_dir)
     print(f"Analyzing: {tracker.root_path}")
-    tracker.analyze_directory(exclude_patterns=args.exclude)
+    tracker.analyze_directory(exclude_patterns=args.exclude, max_workers=args.workers)
+    if tracker.cache_dir:
+        print(f"Parse cache: {tracker.cache_hits} hits, {tracker.cache_misses} misses")
     
     # Print summary
     tracker.print_summary()
@@ -799,38 +992,35 @@ def main():
         print("\nComparing with previous version...")
         changes = tracker.compare_with_previous(args.compare)
         
-        print("\n" + "=" * 70)
-        print("CHANGES DETECTED")
-        print("=" * 70)
+        lines = ["", "=" * 70, "CHANGES DETECTED", "=" * 70]
         
         if changes.get("models_added"):
-            print(f"\n✓ Models Added: {len(changes['models_added'])}")
-            for model in changes["models_added"]:
-                print(f"  + {model}")
+            lines.append(f"\n✓ Models Added: {len(changes['models_added'])}")
+            lines.extend(f"  + {model}" for model in changes["models_added"])
         
         if changes.get("models_removed"):
-            print(f"\n✗ Models Removed: {len(changes['models_removed'])}")
-            for model in changes["models_removed"]:
-                print(f"  - {model}")
+            lines.append(f"\n✗ Models Removed: {len(changes['models_removed'])}")
+            lines.extend(f"  - {model}" for model in changes["models_removed"])
         
         if changes.get("models_modified"):
-            print(f"\n~ Models Modified: {len(changes['models_modified'])}")
+            lines.append(f"\n~ Models Modified: {len(changes['models_modified'])}")
+            fields_added = changes.get("fields_added", {})
+            fields_removed = changes.get("fields_removed", {})
+            fields_modified = changes.get("fields_modified", {})
             for model in changes["models_modified"]:
-                print(f"  ~ {model}")
-                if model in changes.get("fields_added", {}):
-                    for field in changes["fields_added"][model]:
-                        print(f"      + field: {field}")
-                if model in changes.get("fields_removed", {}):
-                    for field in changes["fields_removed"][model]:
-                        print(f"      - field: {field}")
-                if model in changes.get("fields_modified", {}):
-                    for field in changes["fields_modified"][model]:
-                        print(f"      ~ field: {field}")
+                lines.append(f"  ~ {model}")
+                lines.extend(f"      + field: {field}" for field in fields_added.get(model, ()))
+                lines.extend(f"      - field: {field}" for field in fields_removed.get(model, ()))
+                lines.extend(f"      ~ field: {field}" for field in fields_modified.get(model, ()))
         
         if changes.get("breaking_changes"):
-            print(f"\n⚠ BREAKING CHANGES: {len(changes['breaking_changes'])}")
-            for change in changes["breaking_changes"]:
-                print(f"  ⚠ {change['type']}: {change.get('model', '')}.{change.get('field', '')}")
+            lines.append(f"\n⚠ BREAKING CHANGES: {len(changes['breaking_changes'])}")
+            lines.extend(
+                f"  ⚠ {change['type']}: {change.get('model', '')}.{change.get('field', '')}"
+                for change in changes["breaking_changes"]
+            )
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Export changes
         changes_file = output_dir / "changes.json"
@@ -25,14 +25,30 @@ Usage:
 
 import sys
 import json
-import argparse
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type, get_origin, get_args
-from dataclasses import dataclass
-import inspect
+from types import UnionType
+from enum import Enum
+from typing import Dict, List, Optional, Any, Type, Union, Literal, Annotated, ForwardRef, get_origin, get_args
+from dataclasses import dataclass, field
 
 
-@dataclass
+# JSON schema keywords rendered as constraints, in display order
+SCHEMA_CONSTRAINTS = (
+    ('minLength', "min length: {}"),
+    ('maxLength', "max length: {}"),
+    ('minimum', "minimum: {}"),
+    ('maximum', "maximum: {}"),
+    ('pattern', "pattern: `{}`"),
+    ('format', "format: {}"),
+)
+
+_NONE_TYPE = type(None)
+
+# Display names for builtin generics spelled in lower case (set[str] -> Set[str])
+BUILTIN_GENERIC_NAMES = {set: "Set", frozenset: "FrozenSet", type: "Type"}
+
+
+@dataclass(slots=True)
 class FieldInfo:
     """Field documentation info."""
     name: str
@@ -40,11 +56,7 @@ class FieldInfo:
     required: bool
     description: str = ""
     default: Any = None
-    constraints: List[str] = None
-    
-    def __post_init__(self):
-        if self.constraints is None:
-            self.constraints = []
+    constraints: List[str] = field(default_factory=list)
 
 
 def setup_collider_path(collider_path: Optional[str] = None) -> Path:
@@ -64,12 +76,12 @@ def setup_collider_path(collider_path: Optional[str] = None) -> Path:
         print(f"Error: Collider repository not found at {path}", file=sys.stderr)
         sys.exit(1)
     
-    if str(path) not in sys.path:
-        sys.path.insert(0, str(path))
-    
-    collider_src = path / "src"
-    if str(collider_src) not in sys.path:
-        sys.path.insert(0, str(collider_src))
+    # Repo root, then src/ (ends up first)
+    known_paths = set(sys.path)
+    for entry in (str(path), str(path / "src")):
+        if entry not in known_paths:
+            sys.path.insert(0, entry)
+            known_paths.add(entry)
     
     return path
 
@@ -92,8 +104,8 @@ def load_pydantic_models() -> Dict[str, Type]:
         for package in model_packages:
             try:
                 module = __import__(package, fromlist=['*'])
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and 
+                for name, obj in list(vars(module).items()):
+                    if (isinstance(obj, type) and 
                         issubclass(obj, BaseModel) and 
                         obj is not BaseModel and
                         not name.startswith('_')):
@@ -117,16 +129,42 @@ def get_package_name(model_class: Type) -> str:
     return 'unknown'
 
 
+# Keyed on (type, repr), not the object: typing objects compare equal across spellings
+# and argument orders (Union[int, str] == Union[str, int] == int | str)
+_formatted_annotations: Dict[tuple, str] = {}
+
+
 def format_type_annotation(annotation: Any) -> str:
-    """Format type annotation as readable string."""
-    if hasattr(annotation, '__name__'):
+    """Format type annotation as readable string (memoized per spelling)."""
+    # Plain classes (str, int, nested models); typing aliases also carry a __name__
+    if isinstance(annotation, type):
         return annotation.__name__
     
+    key = (type(annotation), repr(annotation))
+    formatted = _formatted_annotations.get(key)
+    if formatted is None:
+        formatted = _formatted_annotations[key] = _format_type_annotation(annotation)
+    return formatted
+
+
+def _format_type_annotation(annotation: Any) -> str:
+    """Format a non-class annotation (uncached)."""
     origin = get_origin(annotation)
     args = get_args(annotation)
     
     if origin is None:
-        return str(annotation)
+        if annotation is Ellipsis:
+            return "..."
+        if isinstance(annotation, list):  # Callable parameter list
+            return f"[{', '.join(format_type_annotation(arg) for arg in annotation)}]"
+        if isinstance(annotation, ForwardRef):
+            return annotation.__forward_arg__
+        return annotation.__name__ if hasattr(annotation, '__name__') else str(annotation)
+    
+    # Handle Optional (Optional[X] and X | None)
+    if (origin is Union or origin is UnionType) and len(args) == 2 and _NONE_TYPE in args:
+        non_none = args[0] if args[1] is _NONE_TYPE else args[1]
+        return f"Optional[{format_type_annotation(non_none)}]"
     
     if origin is list or origin is List:
         if args:
@@ -144,20 +182,33 @@ def format_type_annotation(annotation: Any) -> str:
             return f"Tuple[{', '.join(arg_strs)}]"
         return "Tuple"
     
-    # Handle Optional
-    if len(args) == 2 and type(None) in args:
-        non_none = args[0] if args[1] is type(None) else args[1]
-        return f"Optional[{format_type_annotation(non_none)}]"
+    if origin is Union or origin is UnionType:
+        arg_strs = ["None" if arg is _NONE_TYPE else format_type_annotation(arg) for arg in args]
+        return f"Union[{', '.join(arg_strs)}]"
+    
+    if origin is Literal:
+        values = [f"{type(arg).__name__}.{arg.name}" if isinstance(arg, Enum) else repr(arg) for arg in args]
+        return f"Literal[{', '.join(values)}]"
+    
+    if origin is Annotated:
+        return format_type_annotation(args[0])
     
-    return str(annotation)
+    # Other generics (Set, FrozenSet, Sequence, Callable, Type, user generics)
+    name = getattr(annotation, '_name', None) or BUILTIN_GENERIC_NAMES.get(origin) or getattr(origin, '__name__', None)
+    if name is None:
+        return str(annotation)
+    if args:
+        return f"{name}[{', '.join(format_type_annotation(arg) for arg in args)}]"
+    return name
 
 
-def extract_field_info(model_class: Type) -> List[FieldInfo]:
-    """Extract field information from model."""
+def extract_field_info(model_class: Type, schema: Optional[Dict[str, Any]] = None) -> List[FieldInfo]:
+    """Extract field information from model (reusing its JSON schema if already built)."""
     fields = []
     
     try:
-        schema = model_class.model_json_schema()
+        if schema is None:
+            schema = model_class.model_json_schema()
         properties = schema.get('properties', {})
         required_fields = set(schema.get('required', []))
         
@@ -176,25 +227,18 @@ def extract_field_info(model_class: Type) -> List[FieldInfo]:
             
             # Default
             default_value = None
-            if not is_required and field_obj.default is not None:
-                default_value = field_obj.default
-            elif not is_required and field_obj.default_factory is not None:
-                default_value = "<factory>"
+            if not is_required:
+                if field_obj.default is not None:
+                    default_value = field_obj.default
+                elif field_obj.default_factory is not None:
+                    default_value = "<factory>"
             
             # Constraints
-            constraints = []
-            if 'minLength' in prop_schema:
-                constraints.append(f"min length: {prop_schema['minLength']}")
-            if 'maxLength' in prop_schema:
-                constraints.append(f"max length: {prop_schema['maxLength']}")
-            if 'minimum' in prop_schema:
-                constraints.append(f"minimum: {prop_schema['minimum']}")
-            if 'maximum' in prop_schema:
-                constraints.append(f"maximum: {prop_schema['maximum']}")
-            if 'pattern' in prop_schema:
-                constraints.append(f"pattern: `{prop_schema['pattern']}`")
-            if 'format' in prop_schema:
-                constraints.append(f"format: {prop_schema['format']}")
+            constraints = [
+                template.format(prop_schema[key])
+                for key, template in SCHEMA_CONSTRAINTS
+                if key in prop_schema
+            ]
             
             fields.append(FieldInfo(
                 name=field_name,
@@ -214,7 +258,14 @@ def extract_field_info(model_class: Type) -> List[FieldInfo]:
 def generate_model_doc(model_name: str, model_class: Type, with_examples: bool = False) -> str:
     """Generate markdown documentation for a model."""
     package = get_package_name(model_class)
-    fields = extract_field_info(model_class)
+    
+    # Schema generation walks the whole model; build it once for fields and the JSON section
+    try:
+        schema = model_class.model_json_schema()
+        schema_error = None
+    except Exception as e:
+        schema, schema_error = None, e
+    fields = extract_field_info(model_class, schema)
     
     # Header
     doc = f"# {model_name}\n\n"
@@ -265,11 +316,10 @@ def generate_model_doc(model_name: str, model_class: Type, with_examples: bool =
     doc += "---\n\n"
     doc += "## JSON Schema\n\n"
     doc += "```json\n"
-    try:
-        schema = model_class.model_json_schema()
+    if schema_error is None:
         doc += json.dumps(schema, indent=2)
-    except Exception as e:
-        doc += f"// Error generating schema: {e}\n"
+    else:
+        doc += f"// Error generating schema: {schema_error}\n"
     doc += "\n```\n\n"
     
     # Example
@@ -282,16 +332,21 @@ def generate_model_doc(model_name: str, model_class: Type, with_examples: bool =
         example_fields = []
         for field in fields:
             if field.required:
-                if 'str' in field.type_str.lower():
+                type_lower = field.type_str.lower()
+                # Containers by their outer type first: List[str] must not match 'str'.
+                # Compared as whole names so models like Settings or Listing are not containers
+                outer_type = type_lower[len('optional['):-1] if type_lower.startswith('optional[') else type_lower
+                outer_name = outer_type.split('[', 1)[0]
+                if outer_name in ('list', 'set', 'frozenset', 'tuple'):
+                    example_fields.append(f'  "{field.name}": []')
+                elif outer_name == 'dict':
+                    example_fields.append(f'  "{field.name}": {{}}')
+                elif 'str' in type_lower:
                     example_fields.append(f'  "{field.name}": "example_value"')
-                elif 'int' in field.type_str.lower():
+                elif 'int' in type_lower:
                     example_fields.append(f'  "{field.name}": 0')
-                elif 'bool' in field.type_str.lower():
+                elif 'bool' in type_lower:
                     example_fields.append(f'  "{field.name}": true')
-                elif 'list' in field.type_str.lower():
-                    example_fields.append(f'  "{field.name}": []')
-                elif 'dict' in field.type_str.lower():
-                    example_fields.append(f'  "{field.name}": {{}}')
                 else:
                     example_fields.append(f'  "{field.name}": null')
         
@@ -334,6 +389,8 @@ def generate_index(models: Dict[str, Type]) -> str:
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate markdown documentation for Pydantic models",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -0,0 +1,39 @@
+"""Regression tests for model_docs_generator.py (run with pytest)"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from model_docs_generator import generate_model_doc
+
+
+class Settings(BaseModel):
+    theme: str
+
+
+class Listing(BaseModel):
+    title: str
+
+
+class Profile(BaseModel):
+    settings: Settings
+    listing: Optional[Listing]
+    tags: List[str]
+    maybe_tags: Optional[list]
+    labels: Dict[str, str]
+
+
+def test_example_does_not_treat_nested_models_as_containers():
+    """Model names starting with set/list/dict/tuple still get null, real generics do not"""
+    doc = generate_model_doc("Profile", Profile, with_examples=True)
+    example = doc.split("## Example", 1)[1]
+    
+    assert '"settings": null' in example
+    assert '"listing": null' in example
+    assert '"tags": []' in example
+    assert '"maybe_tags": []' in example
+    assert '"labels": {}' in example
@@ -18,14 +18,15 @@ Usage:
 """
 
 import sys
-import json
-import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 
 
+@lru_cache(maxsize=None)
 def setup_collider_path(collider_path: Optional[str] = None) -> Path:
-    """Set up path to collider repository."""
+    """Set up path to collider repository (resolved once per argument)."""
     if collider_path:
         path = Path(collider_path)
     else:
@@ -41,60 +42,78 @@ def setup_collider_path(collider_path: Optional[str] = None) -> Path:
         print(f"Error: Collider repository not found at {path}", file=sys.stderr)
         sys.exit(1)
     
-    if str(path) not in sys.path:
-        sys.path.insert(0, str(path))
-    
-    collider_src = path / "src"
-    if str(collider_src) not in sys.path:
-        sys.path.insert(0, str(collider_src))
+    # Repo root, then src/ (ends up first)
+    known_paths = set(sys.path)
+    for entry in (str(path), str(path / "src")):
+        if entry not in known_paths:
+            sys.path.insert(0, entry)
+            known_paths.add(entry)
     
     return path
 
 
-def load_method_registry() -> Dict[str, Any]:
-    """Load MANAGED_METHODS registry."""
+@lru_cache(maxsize=1)
+def load_method_registry() -> Mapping[str, Any]:
+    """Load MANAGED_METHODS registry as a read-only view (no copy, imported once)."""
     try:
         from pydantic_ai_integration.method_registry import MANAGED_METHODS
-        import src
-        return dict(MANAGED_METHODS)
+        if not MANAGED_METHODS:
+            # Package auto-init normally fills the registry; importing all of src is
+            # only needed when it was skipped (e.g. SKIP_AUTO_INIT)
+            import src
+        return MappingProxyType(MANAGED_METHODS)
     except ImportError as e:
         print(f"Error: Could not import MANAGED_METHODS: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def suggest_methods_for_goal(goal: str, registry: Dict[str, Any]) -> List[tuple[str, str, float]]:
+# method name -> (method_def, lowercased name, description, domain, capability)
+_search_text_cache: Dict[str, tuple] = {}
+
+
+def _search_text(method_name: str, method_def: Any) -> tuple:
+    """Lowercased searchable text of a method, computed once per definition."""
+    cached = _search_text_cache.get(method_name)
+    if cached is None or cached[0] is not method_def:
+        description = getattr(method_def, 'description', None) or ""
+        classification = getattr(method_def, 'classification', None)
+        domain = getattr(classification, 'domain', None) or ""
+        capability = getattr(classification, 'capability', None) or ""
+        cached = (method_def, method_name.lower(), description.lower(), domain.lower(), capability.lower())
+        _search_text_cache[method_name] = cached
+    return cached
+
+
+def suggest_methods_for_goal(goal: str, registry: Mapping[str, Any]) -> List[tuple[str, str, float]]:
     """Suggest methods that match the goal."""
     suggestions = []
     goal_lower = goal.lower()
     
     # Keywords to look for
     keywords = [word for word in goal_lower.split() if len(word) > 3]
+    if not keywords:
+        # Nothing can score above zero; skip the registry scan
+        return suggestions
     
     for method_name, method_def in registry.items():
         score = 0.0
+        _, name_lower, desc_lower, domain_lower, capability_lower = _search_text(method_name, method_def)
         
         # Check method name
-        if any(kw in method_name.lower() for kw in keywords):
+        if any(kw in name_lower for kw in keywords):
             score += 2.0
         
         # Check description
-        if hasattr(method_def, 'description') and method_def.description:
-            desc_lower = method_def.description.lower()
-            for kw in keywords:
-                if kw in desc_lower:
-                    score += 1.0
+        for kw in keywords:
+            if kw in desc_lower:
+                score += 1.0
         
         # Check classification
-        if hasattr(method_def, 'classification'):
-            classification = method_def.classification
-            
-            if hasattr(classification, 'domain') and classification.domain:
-                if any(kw in classification.domain.lower() for kw in keywords):
-                    score += 1.5
-            
-            if hasattr(classification, 'capability') and classification.capability:
-                if any(kw in classification.capability.lower() for kw in keywords):
-                    score += 1.5
+        if any(kw in domain_lower for kw in keywords):
+            score += 1.5
+        
+        if any(kw in capability_lower for kw in keywords):
+            score += 1.5
         
         if score > 0:
             desc = getattr(method_def, 'description', method_name)
@@ -106,7 +125,17 @@ def suggest_methods_for_goal(goal: str, registry: Dict[str, Any]) -> List[tuple[
     return suggestions
 
 
-def interactive_mode(registry: Dict[str, Any]):
+def _format_suggestions(suggestions: List[tuple[str, str, float]]) -> List[str]:
+    """Numbered listing lines for suggested methods."""
+    lines = []
+    for i, (method_name, desc, score) in enumerate(suggestions, 1):
+        lines.append(f"{i}. {method_name} (score: {score:.1f})")
+        lines.append(f"   {desc}")
+        lines.append("")
+    return lines
+
+
+def interactive_mode(registry: Mapping[str, Any]):
     """Run interactive workflow builder."""
     print("\n" + "=" * 80)
     print("Interactive Workflow Builder")
@@ -129,14 +158,12 @@ def interactive_mode(registry: Dict[str, Any]):
         print("No matching methods found.")
         return
     
-    print(f"\nFound {len(suggestions)} matching methods:")
-    print("-" * 80)
+    lines = [f"\nFound {len(suggestions)} matching methods:", "-" * 80]
     
     # Show top 10
-    for i, (method_name, desc, score) in enumerate(suggestions[:10], 1):
-        print(f"{i}. {method_name} (score: {score:.1f})")
-        print(f"   {desc}")
-        print()
+    lines.extend(_format_suggestions(suggestions[:10]))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Select methods
     print("Select methods to include in workflow (comma-separated numbers, e.g., '1,3,5'):")
@@ -212,7 +239,7 @@ def interactive_mode(registry: Dict[str, Any]):
         print(f"Error generating workflow: {e}", file=sys.stderr)
 
 
-def quick_build(goal: str, registry: Dict[str, Any], top_n: int = 5):
+def quick_build(goal: str, registry: Mapping[str, Any], top_n: int = 5):
     """Quick build workflow from goal (non-interactive)."""
     print(f"\nGoal: {goal}")
     print("=" * 80)
@@ -223,20 +250,17 @@ def quick_build(goal: str, registry: Dict[str, Any], top_n: int = 5):
         print("No matching methods found.")
         return
     
-    print(f"\nTop {top_n} suggested methods:")
-    print("-" * 80)
-    
-    for i, (method_name, desc, score) in enumerate(suggestions[:top_n], 1):
-        print(f"{i}. {method_name} (score: {score:.1f})")
-        print(f"   {desc}")
-        print()
+    lines = [f"\nTop {top_n} suggested methods:", "-" * 80]
+    lines.extend(_format_suggestions(suggestions[:top_n]))
     
     selected_methods = [s[0] for s in suggestions[:top_n]]
     workflow_name = "_".join(selected_methods[:3]) + "_workflow"
     
-    print(f"Auto-selected workflow: {', '.join(selected_methods)}")
-    print(f"Workflow name: {workflow_name}")
-    print()
+    lines.append(f"Auto-selected workflow: {', '.join(selected_methods)}")
+    lines.append(f"Workflow name: {workflow_name}")
+    lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Generate composite tool
     try:
@@ -265,7 +289,7 @@ def quick_build(goal: str, registry: Dict[str, Any], top_n: int = 5):
         print(f"Error generating workflow: {e}", file=sys.stderr)
 
 
-def preset_build(methods: List[str], registry: Dict[str, Any], output: Optional[str] = None):
+def preset_build(methods: List[str], registry: Mapping[str, Any], output: Optional[str] = None):
     """Build workflow from preset methods."""
     print(f"\nBuilding workflow from: {', '.join(methods)}")
     print("=" * 80)
@@ -312,6 +336,8 @@ def preset_build(methods: List[str], registry: Dict[str, Any], output: Optional[
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Interactive workflow builder: goal → methods → YAML",
         formatter_class=argparse.RawDescriptionHelpFormatter,
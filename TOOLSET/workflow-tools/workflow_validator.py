@@ -25,11 +25,11 @@ Usage:
 
 import sys
 import json
-import argparse
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass
@@ -204,8 +204,9 @@ def validate_parameter_flow(methods: List[str], collider_path: Path) -> tuple[Li
     return issues, score
 
 
+@lru_cache(maxsize=None)
 def get_method_metadata(method: str, collider_path: Path) -> Optional[Dict[str, Any]]:
-    """Get metadata for a single method."""
+    """Get metadata for a single method (one method_search subprocess per method per run)."""
     result = run_tool('method_search', [method], collider_path)
     
     if 'error' in result or not result.get('methods'):
@@ -237,19 +238,11 @@ def suggest_workflow_fixes(issues: List[WorkflowIssue], methods: List[str], coll
                     f"python model_field_search.py \"<field_name>\""
                 )
     
-    # Check for method classification issues
-    metadata_cache = {}
-    for i in range(len(methods) - 1):
-        source = methods[i]
-        target = methods[i + 1]
-        
-        if source not in metadata_cache:
-            metadata_cache[source] = get_method_metadata(source, collider_path)
-        if target not in metadata_cache:
-            metadata_cache[target] = get_method_metadata(target, collider_path)
-        
-        source_meta = metadata_cache[source]
-        target_meta = metadata_cache[target]
+    # Check for method classification issues (get_method_metadata is memoized,
+    # so metadata fetched by validate_workflow is reused here)
+    for source, target in zip(methods, methods[1:]):
+        source_meta = get_method_metadata(source, collider_path)
+        target_meta = get_method_metadata(target, collider_path)
         
         if source_meta and target_meta:
             # Check if complexity is compatible
@@ -287,8 +280,8 @@ def validate_workflow(
     result.issues.extend(flow_issues)
     result.parameter_flow_score = score
     
-    # Collect metadata
-    for method in methods:
+    # Collect metadata (once per distinct method; chains may repeat a method)
+    for method in dict.fromkeys(methods):
         meta = get_method_metadata(method, collider_path)
         if meta:
             result.metadata[method] = {
@@ -317,57 +310,66 @@ def validate_workflow(
 
 def print_validation_result(result: WorkflowValidationResult, full_report: bool = False):
     """Print validation result in human-readable format."""
-    
-    print("\n" + "=" * 80)
-    print(f"Workflow Validation: {' → '.join(result.methods)}")
-    print("=" * 80 + "\n")
+    # Issues by severity; the header counts come from these buckets
+    by_severity = {'error': [], 'warning': [], 'info': []}
+    for issue in result.issues:
+        bucket = by_severity.get(issue.severity)
+        if bucket is not None:
+            bucket.append(issue)
+    errors = by_severity['error']
+    warnings = by_severity['warning']
+    infos = by_severity['info']
+    
+    lines = []
+    
+    lines.append("\n" + "=" * 80)
+    lines.append(f"Workflow Validation: {' → '.join(result.methods)}")
+    lines.append("=" * 80 + "\n")
     
     # Overall status
     status_icon = "✓" if result.valid else "✗"
     status_text = "VALID" if result.valid else "INVALID"
-    print(f"Status: {status_icon} {status_text}")
-    print(f"Parameter Flow Score: {result.parameter_flow_score:.1%}")
-    print(f"Issues: {result.error_count} errors, {result.warning_count} warnings\n")
+    lines.append(f"Status: {status_icon} {status_text}")
+    lines.append(f"Parameter Flow Score: {result.parameter_flow_score:.1%}")
+    lines.append(f"Issues: {len(errors)} errors, {len(warnings)} warnings\n")
     
     # Issues by severity
     if result.issues:
-        errors = [i for i in result.issues if i.severity == 'error']
-        warnings = [i for i in result.issues if i.severity == 'warning']
-        infos = [i for i in result.issues if i.severity == 'info']
-        
         if errors:
-            print("✗ ERRORS:\n")
+            lines.append("✗ ERRORS:\n")
             for issue in errors:
                 step_text = f"[Step {issue.step}] " if issue.step else ""
-                print(f"  {step_text}{issue.message}")
+                lines.append(f"  {step_text}{issue.message}")
                 if issue.suggestion and full_report:
-                    print(f"    → Suggestion: {issue.suggestion}")
-            print()
+                    lines.append(f"    → Suggestion: {issue.suggestion}")
+            lines.append("")
         
         if warnings:
-            print("⚠ WARNINGS:\n")
+            lines.append("⚠ WARNINGS:\n")
             for issue in warnings:
                 step_text = f"[Step {issue.step}] " if issue.step else ""
-                print(f"  {step_text}{issue.message}")
-            print()
+                lines.append(f"  {step_text}{issue.message}")
+            lines.append("")
         
         if infos and full_report:
-            print("ℹ SUGGESTIONS:\n")
+            lines.append("ℹ SUGGESTIONS:\n")
             for issue in infos:
-                print(f"  • {issue.message}")
-            print()
+                lines.append(f"  • {issue.message}")
+            lines.append("")
     
     # Method metadata
     if full_report and result.metadata:
-        print("METHOD DETAILS:\n")
+        lines.append("METHOD DETAILS:\n")
         for method, meta in result.metadata.items():
-            print(f"  {method}:")
-            print(f"    Domain: {meta.get('domain')}")
-            print(f"    Capability: {meta.get('capability')}")
-            print(f"    Complexity: {meta.get('complexity')}")
-        print()
+            lines.append(f"  {method}:")
+            lines.append(f"    Domain: {meta.get('domain')}")
+            lines.append(f"    Capability: {meta.get('capability')}")
+            lines.append(f"    Complexity: {meta.get('complexity')}")
+        lines.append("")
+    
+    lines.append("=" * 80 + "\n")
     
-    print("=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_validation_json(result: WorkflowValidationResult):
@@ -391,10 +393,13 @@ def print_validation_json(result: WorkflowValidationResult):
         'metadata': result.metadata
     }
     
-    print(json.dumps(output, indent=2))
+    json.dump(output, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Comprehensive workflow validation",
         formatter_class=argparse.RawDescriptionHelpFormatter,